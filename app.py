@@ -1,37 +1,143 @@
 from flask import Flask, render_template, jsonify, request
 import json
-import io
+import queue
+import re
 import sys
-from contextlib import redirect_stdout
-from wake_on_lan_script import send_wol_packet, get_comprehensive_network_info
+import threading
+import time
+from concurrent.futures import Future
+from wake_on_lan_script import (send_wol_packet, get_cached_network_info,
+                                _build_magic_packet, _get_wol_socket,
+                                _sendmmsg_batch)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Serve jsonify responses through orjson instead of stdlib json."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+class BatchWakeQueue:
+    """
+    Coalesce concurrent wake requests into single passes over the socket.
+
+    Handlers enqueue (mac, broadcast, port) jobs and wait on a Future; a
+    background worker drains whatever accumulates within a short window and
+    sends all the magic packets in one tight loop, so throughput scales
+    with queue depth instead of request-thread count.
+    """
+
+    def __init__(self, max_batch=64, window=0.01):
+        self._queue = queue.Queue()
+        self._max_batch = max_batch
+        self._window = window
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, mac_address, broadcast='255.255.255.255', port=9,
+               verbose=False):
+        """Queue a wake job; the Future resolves to (success, log_lines)."""
+        future = Future()
+        self._queue.put((mac_address, broadcast, port, verbose, future))
+        return future
+
+    def _run(self):
+        while True:
+            # Block for the first job, then drain for up to the window
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            # Build (and cache) every magic packet first, so the send loop
+            # below runs back-to-back sendto calls with no parsing between
+            # syscalls; bad MACs fail their future before anything is sent
+            pending = []
+            for job in batch:
+                mac_address, _, _, _, future = job
+                try:
+                    _build_magic_packet(mac_address)
+                    pending.append(job)
+                except Exception as e:
+                    future.set_exception(e)
+
+            # On Linux a multi-packet batch goes out in a single sendmmsg
+            # syscall; anything it can't handle falls through to sendto
+            if len(pending) > 1:
+                datagrams = [(_build_magic_packet(mac_address), (broadcast, port))
+                             for mac_address, broadcast, port, _, _ in pending]
+                sent = _sendmmsg_batch(_get_wol_socket(), datagrams)
+                if sent is not None and sent > 0:
+                    for mac_address, broadcast, port, verbose, future in pending[:sent]:
+                        future.set_result(
+                            (True, [f"✓ Packet sent successfully to {broadcast}:{port}"]))
+                    pending = pending[sent:]
+
+            for mac_address, broadcast, port, verbose, future in pending:
+                try:
+                    future.set_result(
+                        send_wol_packet(mac_address, broadcast, port,
+                                        verbose=verbose))
+                except Exception as e:
+                    future.set_exception(e)
+
+batch_queue = BatchWakeQueue()
+
+# Accepts aa:bb:cc:dd:ee:ff, aa-bb-cc-dd-ee-ff and bare aabbccddeeff
+_MAC_RE = re.compile(r'^([0-9A-Fa-f]{2}[:\-]?){5}[0-9A-Fa-f]{2}$')
+
 @app.route('/')
 def index():
     try:
-        # Get network information
-        network_info = get_comprehensive_network_info()
+        # Get network information (cached with a TTL; scanning is expensive)
+        network_info = get_cached_network_info()
         return render_template('index.html', network_info=network_info)
     except Exception as e:
         return str(e), 500
 
 @app.route('/wake', methods=['POST'])
 def wake():
+    # Validate before doing any socket work so malformed requests 400
+    # immediately; silent/force parsing avoids raising on a missing
+    # Content-Type header
+    data = request.get_json(silent=True, force=True) or {}
+    mac_address = data.get('mac_address')
+    broadcast = data.get('broadcast', '255.255.255.255')
+
+    if not mac_address:
+        return jsonify({'error': 'MAC address is required'}), 400
+    if not _MAC_RE.match(mac_address):
+        return jsonify({'error': 'Invalid MAC address format'}), 400
+
     try:
-        data = request.json
-        mac_address = data.get('mac_address')
-        broadcast = data.get('broadcast', '255.255.255.255')
-        
-        if not mac_address:
-            return jsonify({'error': 'MAC address is required'}), 400
-            
-        # Capture the terminal output
-        output = io.StringIO()
-        with redirect_stdout(output):
-            success = send_wol_packet(mac_address, broadcast)
-        
-        terminal_output = output.getvalue()
+        # Packet-structure details are included only when ?debug=1. The
+        # send itself happens on the batch worker so request threads never
+        # touch the socket directly.
+        verbose = bool(request.args.get('debug'))
+        success, log_lines = batch_queue.submit(
+            mac_address, broadcast, verbose=verbose).result()
+
+        terminal_output = '\n'.join(log_lines)
         
         if success:
             return jsonify({
@@ -43,9 +149,52 @@ def wake():
                 'error': 'Failed to send Wake-on-LAN packet',
                 'terminal_output': terminal_output
             }), 500
-            
+
+    except (ValueError, OSError) as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/wake_batch', methods=['POST'])
+def wake_batch():
+    try:
+        data = request.json
+        targets = data.get('targets')
+
+        if not targets:
+            return jsonify({'error': 'targets list is required'}), 400
+
+        # Validate the whole list before enqueuing anything: a bad entry
+        # must 400 with zero packets sent, not after part of the batch
+        # already went out
+        for target in targets:
+            mac_address = target.get('mac_address')
+            if not mac_address:
+                return jsonify({'error': 'MAC address is required for every target'}), 400
+            if not _MAC_RE.match(mac_address):
+                return jsonify({'error': f'Invalid MAC address format: {mac_address}'}), 400
+
+        # Enqueue everything first so the worker sends the whole batch in
+        # one pass, then collect results
+        futures = [(target['mac_address'], batch_queue.submit(
+            target['mac_address'],
+            target.get('broadcast', '255.255.255.255'),
+            target.get('port', 9)))
+            for target in targets]
+
+        results = [{'mac_address': mac_address, 'success': future.result()[0]}
+                   for mac_address, future in futures]
+
+        return jsonify({'results': results})
+
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Prefer waitress when it's installed (same server wsgi.py documents);
+    # otherwise fall back to the threaded dev server with debug/reloader
+    # off so concurrent /wake and / requests don't queue behind each other.
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host='0.0.0.0', port=5000, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=5000, threads=8, connection_limit=200)
@@ -4,10 +4,10 @@ from io import StringIO
 from unittest.mock import patch, MagicMock
 from unittest.mock import patch, mock_open
 import json
-import netifaces
 import platform
 import psutil
 import pytest
+import socket
 import sys
 
 class TestWakeOnLanScript:
@@ -19,14 +19,15 @@ class TestWakeOnLanScript:
         with patch('platform.system', return_value='Windows'), \
              patch('platform.version', return_value='10.0.19041'), \
              patch('platform.node', return_value='TestPC'), \
-             patch('netifaces.interfaces', return_value=['eth0']), \
-             patch('netifaces.ifaddresses') as mock_ifaddresses, \
+             patch('psutil.net_if_addrs') as mock_net_if_addrs, \
              patch('psutil.net_if_stats') as mock_net_if_stats, \
              patch('WAKEONLAN.wake_on_lan_script.check_windows_wol_support', return_value={'wol_support': True, 'wol_config_notes': ['Test note']}):
 
-            mock_ifaddresses.return_value = {
-                netifaces.AF_LINK: [{'addr': '00:11:22:33:44:55'}],
-                netifaces.AF_INET: [{'addr': '192.168.1.100'}]
+            mock_net_if_addrs.return_value = {
+                'eth0': [
+                    MagicMock(family=psutil.AF_LINK, address='00:11:22:33:44:55'),
+                    MagicMock(family=socket.AF_INET, address='192.168.1.100')
+                ]
             }
             mock_net_if_stats.return_value = {'eth0': MagicMock(isup=True)}
 
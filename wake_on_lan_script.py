@@ -1,13 +1,277 @@
+import concurrent.futures
+import functools
 import json
+import os
 import platform
+import re
 import socket
 import subprocess
+import threading
+import time
 import uuid
-import winreg
 
-import netifaces
+# The platform never changes during a process lifetime; evaluate once
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# winreg only exists on Windows; every use below sits behind a platform
+# check, so guard the import to keep the module importable elsewhere
+if _IS_WINDOWS:
+    import winreg
+
 import psutil
 
+# orjson serializes several times faster than the stdlib json module;
+# fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# How long a cached network snapshot stays fresh (seconds). Interface
+# topology changes rarely, so the web UI can safely reuse a recent scan.
+NETWORK_INFO_TTL = 30.0
+
+_network_info_lock = threading.Lock()
+_cached_network_info = None
+_cached_network_info_ts = 0.0
+
+# Netlink multicast groups for link and IPv4 address changes
+_RTMGRP_LINK = 0x1
+_RTMGRP_IPV4_IFADDR = 0x10
+
+_change_listener_started = False
+
+def _interface_change_listener():
+    """
+    Block on the OS interface-change notification and bust the cache.
+
+    On Linux this listens on an rtnetlink socket; on Windows it waits in
+    NotifyAddrChange. Platforms without a notification source simply fall
+    back to the TTL in get_cached_network_info.
+    """
+    system = platform.system()
+
+    if system == 'Linux':
+        try:
+            sock = socket.socket(
+                socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            sock.bind((0, _RTMGRP_LINK | _RTMGRP_IPV4_IFADDR))
+        except OSError:
+            return
+        while True:
+            try:
+                sock.recv(4096)
+            except OSError:
+                return
+            invalidate_network_info_cache()
+
+    elif system == 'Windows':
+        try:
+            import ctypes
+            iphlpapi = ctypes.WinDLL('iphlpapi')
+        except Exception:
+            return
+        while True:
+            # Synchronous form: returns NO_ERROR once the address table
+            # changes, anything else means notifications are unavailable
+            if iphlpapi.NotifyAddrChange(None, None) != 0:
+                return
+            invalidate_network_info_cache()
+
+def _start_change_listener():
+    """Start the change-listener thread once, on first cache use."""
+    global _change_listener_started
+
+    if not _change_listener_started:
+        _change_listener_started = True
+        threading.Thread(
+            target=_interface_change_listener, daemon=True).start()
+
+def get_cached_network_info(ttl=NETWORK_INFO_TTL):
+    """
+    Return get_comprehensive_network_info() memoized with a TTL.
+
+    The full scan walks every interface and (on Windows) hits the registry
+    and netsh, so repeated callers such as the Flask index route should use
+    this wrapper instead of re-scanning on every request. Where the OS
+    offers interface-change notifications the cache is also busted
+    event-driven, so steady state never re-scans before the TTL expires.
+    """
+    global _cached_network_info, _cached_network_info_ts
+
+    _start_change_listener()
+
+    with _network_info_lock:
+        now = time.monotonic()
+        if _cached_network_info is None or now - _cached_network_info_ts >= ttl:
+            _cached_network_info = get_comprehensive_network_info()
+            _cached_network_info_ts = now
+        return _cached_network_info
+
+def invalidate_network_info_cache():
+    """Force the next get_cached_network_info() call to re-scan."""
+    global _cached_network_info
+
+    with _network_info_lock:
+        _cached_network_info = None
+
+# Starting buffer size for GetAdaptersAddresses; grown and remembered across
+# calls so steady-state enumeration needs a single syscall
+_gaa_buf_size = 15 * 1024
+
+def _win_get_adapters():
+    """
+    Enumerate Windows adapters directly via GetAdaptersAddresses.
+
+    Passes the GAA_FLAG_SKIP_* flags for the anycast/multicast/DNS sections
+    we never read (unicast is kept for the IPv4 address), which is much
+    cheaper than a full enumeration. Returns a list of
+    (name, mac_address, ipv4_address, is_up) tuples, or None on failure so
+    callers can fall back to psutil.
+    """
+    global _gaa_buf_size
+
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        iphlpapi = ctypes.WinDLL('iphlpapi')
+
+        class SOCKADDR(ctypes.Structure):
+            _fields_ = [("sa_family", ctypes.c_ushort),
+                        ("sa_data", ctypes.c_ubyte * 14)]
+
+        class SOCKET_ADDRESS(ctypes.Structure):
+            _fields_ = [("lpSockaddr", ctypes.POINTER(SOCKADDR)),
+                        ("iSockaddrLength", ctypes.c_int)]
+
+        class IP_ADAPTER_UNICAST_ADDRESS(ctypes.Structure):
+            pass
+
+        IP_ADAPTER_UNICAST_ADDRESS._fields_ = [
+            ("Length", wintypes.ULONG),
+            ("Flags", wintypes.DWORD),
+            ("Next", ctypes.POINTER(IP_ADAPTER_UNICAST_ADDRESS)),
+            ("Address", SOCKET_ADDRESS),
+        ]
+
+        class IP_ADAPTER_ADDRESSES(ctypes.Structure):
+            pass
+
+        # Leading fields of IP_ADAPTER_ADDRESSES_LH, enough to reach
+        # PhysicalAddress and OperStatus; the rest of the struct is unused
+        IP_ADAPTER_ADDRESSES._fields_ = [
+            ("Length", wintypes.ULONG),
+            ("IfIndex", wintypes.DWORD),
+            ("Next", ctypes.POINTER(IP_ADAPTER_ADDRESSES)),
+            ("AdapterName", ctypes.c_char_p),
+            ("FirstUnicastAddress", ctypes.POINTER(IP_ADAPTER_UNICAST_ADDRESS)),
+            ("FirstAnycastAddress", ctypes.c_void_p),
+            ("FirstMulticastAddress", ctypes.c_void_p),
+            ("FirstDnsServerAddress", ctypes.c_void_p),
+            ("DnsSuffix", ctypes.c_wchar_p),
+            ("Description", ctypes.c_wchar_p),
+            ("FriendlyName", ctypes.c_wchar_p),
+            ("PhysicalAddress", ctypes.c_ubyte * 8),
+            ("PhysicalAddressLength", wintypes.ULONG),
+            ("Flags", wintypes.ULONG),
+            ("Mtu", wintypes.ULONG),
+            ("IfType", wintypes.DWORD),
+            ("OperStatus", ctypes.c_int),
+        ]
+
+        GAA_FLAG_SKIP_ANYCAST = 0x0002
+        GAA_FLAG_SKIP_MULTICAST = 0x0004
+        GAA_FLAG_SKIP_DNS_SERVER = 0x0008
+        GAA_FLAG_SKIP_DNS_INFO = 0x0800
+        flags = (GAA_FLAG_SKIP_ANYCAST | GAA_FLAG_SKIP_MULTICAST |
+                 GAA_FLAG_SKIP_DNS_SERVER | GAA_FLAG_SKIP_DNS_INFO)
+        AF_UNSPEC = 0
+        ERROR_BUFFER_OVERFLOW = 111
+        IF_OPER_STATUS_UP = 1
+
+        size = wintypes.ULONG(_gaa_buf_size)
+        for _ in range(3):
+            buf = ctypes.create_string_buffer(size.value)
+            ret = iphlpapi.GetAdaptersAddresses(
+                AF_UNSPEC, flags, None, buf, ctypes.byref(size))
+            if ret == 0:
+                break
+            if ret != ERROR_BUFFER_OVERFLOW:
+                return None
+        else:
+            return None
+
+        # Remember the required size so the next call succeeds first try
+        _gaa_buf_size = max(_gaa_buf_size, size.value)
+
+        adapters = []
+        addr = ctypes.cast(buf, ctypes.POINTER(IP_ADAPTER_ADDRESSES))
+        while addr:
+            adapter = addr.contents
+
+            name = adapter.AdapterName.decode('ascii', 'replace')
+
+            mac_len = adapter.PhysicalAddressLength
+            if mac_len:
+                mac_address = ':'.join(
+                    f'{b:02x}' for b in adapter.PhysicalAddress[:mac_len])
+            else:
+                mac_address = 'N/A'
+
+            ipv4 = 'N/A'
+            unicast = adapter.FirstUnicastAddress
+            while unicast:
+                sockaddr = unicast.contents.Address.lpSockaddr
+                if sockaddr and sockaddr.contents.sa_family == socket.AF_INET:
+                    ipv4 = '.'.join(str(b) for b in sockaddr.contents.sa_data[2:6])
+                    break
+                unicast = unicast.contents.Next
+
+            adapters.append(
+                (name, mac_address, ipv4, adapter.OperStatus == IF_OPER_STATUS_UP))
+            addr = adapter.Next
+
+        return adapters
+    except Exception:
+        return None
+
+def _enumerate_interfaces():
+    """
+    Return a list of (name, mac_address, ipv4_address, is_up) tuples.
+
+    On Windows this prefers the direct GetAdaptersAddresses path; elsewhere
+    (or if that fails) it falls back to psutil's enumeration.
+    """
+    if _IS_WINDOWS:
+        adapters = _win_get_adapters()
+        if adapters is not None:
+            return adapters
+
+    # Interface status for all NICs in one psutil call, hoisted out of the
+    # loop so we don't re-enumerate the interface table per interface
+    try:
+        stats = psutil.net_if_stats()
+    except Exception:
+        stats = {}
+
+    interfaces = []
+    for interface, snics in psutil.net_if_addrs().items():
+        # MAC Address
+        mac_address = next(
+            (s.address for s in snics if s.family == psutil.AF_LINK), 'N/A')
+
+        # IPv4 Details
+        ipv4 = next(
+            (s.address for s in snics if s.family == socket.AF_INET), 'N/A')
+
+        # An interface with an address is up; otherwise fall back to psutil
+        is_up = ipv4 != 'N/A' or (interface in stats and stats[interface].isup)
+
+        interfaces.append((interface, mac_address, ipv4, is_up))
+
+    return interfaces
+
 def get_comprehensive_network_info():
     """
     Retrieve detailed network and system information for Wake-on-LAN configuration.
@@ -21,30 +285,20 @@ def get_comprehensive_network_info():
         "network_interfaces": []
     }
 
+    # Evaluated once per scan instead of once per interface. A local (not
+    # the module constant) so tests can patch platform.system.
+    is_windows = platform.system() == 'Windows'
+
+    # One registry scan and one netsh run shared by every interface below
+    if is_windows:
+        reg_map = _load_wol_registry_map()
+        netsh_map = _load_netsh_config_map()
+    else:
+        reg_map = netsh_map = None
+
     # Detect network interfaces
-    interfaces = netifaces.interfaces()
-    for interface in interfaces:
+    for interface, mac_address, ipv4, is_up in _enumerate_interfaces():
         try:
-            # MAC Address
-            mac_info = netifaces.ifaddresses(interface).get(netifaces.AF_LINK, [{}])[0]
-            mac_address = mac_info.get('addr', 'N/A')
-            
-            # IPv4 Details
-            ipv4_info = netifaces.ifaddresses(interface).get(netifaces.AF_INET, [])
-            ipv4 = ipv4_info[0]['addr'] if ipv4_info else 'N/A'
-            
-            # Better interface status detection
-            is_up = False
-            try:
-                # Check if interface has an IP address
-                is_up = bool(ipv4_info and ipv4 != 'N/A')
-                if not is_up:
-                    # Double check with psutil
-                    stats = psutil.net_if_stats()
-                    is_up = interface in stats and stats[interface].isup
-            except Exception:
-                is_up = False
-
             # Detailed interface information
             interface_details = {
                 "name": interface,
@@ -54,8 +308,9 @@ def get_comprehensive_network_info():
             }
 
             # Additional WoL-specific checks for Windows
-            if platform.system() == 'Windows':
-                interface_details.update(check_windows_wol_support(interface))
+            if is_windows:
+                interface_details.update(
+                    check_windows_wol_support(interface, reg_map, netsh_map))
 
             network_info["network_interfaces"].append(interface_details)
         
@@ -64,9 +319,77 @@ def get_comprehensive_network_info():
 
     return network_info
 
-def check_windows_wol_support(interface):
+def _load_wol_registry_map():
+    """
+    Scan the network-adapter class key once and map each NetCfgInstanceId
+    to its Wake-on-LAN registry notes.
+
+    Building this dict up front turns the per-interface registry walk into
+    a single lookup, so N interfaces cost one subkey scan instead of N.
+    """
+    reg_map = {}
+
+    try:
+        key_path = r"SYSTEM\CurrentControlSet\Control\Class\{4D36E972-E325-11CE-BFC1-08002bE10318}"
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+            for i in range(winreg.QueryInfoKey(key)[0]):
+                try:
+                    subkey_name = winreg.EnumKey(key, i)
+                    with winreg.OpenKey(key, subkey_name) as subkey:
+                        try:
+                            net_cfg_instance_id = winreg.QueryValueEx(subkey, "NetCfgInstanceId")[0]
+                        except FileNotFoundError:
+                            continue
+                        reg_map[net_cfg_instance_id.lower()] = [
+                            "Network adapter found in registry"]
+                except Exception:
+                    continue
+    except Exception:
+        pass
+
+    return reg_map
+
+def _load_netsh_config_map():
+    """
+    Run `netsh interface ipv4 show config` once and split the output into
+    a dict keyed by lower-cased interface name.
+
+    One subprocess replaces the per-interface netsh spawn the old code
+    did, and passing an argument list (not shell=True) skips the cmd.exe
+    layer.
+    """
+    config_map = {}
+
+    try:
+        output = subprocess.run(
+            ['netsh', 'interface', 'ipv4', 'show', 'config'],
+            capture_output=True, text=True, check=True).stdout
+    except Exception:
+        return config_map
+
+    name = None
+    lines = []
+    for line in output.splitlines():
+        match = re.match(r'Configuration for interface "(.+)"', line.strip())
+        if match:
+            if name is not None:
+                config_map[name.lower()] = '\n'.join(lines)
+            name = match.group(1)
+            lines = []
+        elif name is not None:
+            lines.append(line)
+    if name is not None:
+        config_map[name.lower()] = '\n'.join(lines)
+
+    return config_map
+
+def check_windows_wol_support(interface, reg_map=None, netsh_map=None):
     """
     Check Wake-on-LAN support for Windows network interfaces.
+
+    Pass a prebuilt reg_map from _load_wol_registry_map() and netsh_map
+    from _load_netsh_config_map() when checking several interfaces so the
+    registry and netsh are only consulted once.
     """
     wol_support = {
         "wol_support": False,
@@ -75,37 +398,15 @@ def check_windows_wol_support(interface):
 
     try:
         # Check registry for network adapter WoL settings
-        try:
-            key_path = r"SYSTEM\CurrentControlSet\Control\Class\{4D36E972-E325-11CE-BFC1-08002bE10318}"
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
-                for i in range(winreg.QueryInfoKey(key)[0]):
-                    try:
-                        subkey_name = winreg.EnumKey(key, i)
-                        with winreg.OpenKey(key, subkey_name) as subkey:
-                            try:
-                                net_cfg_instance_id = winreg.QueryValueEx(subkey, "NetCfgInstanceId")[0]
-                                if net_cfg_instance_id == interface:
-                                    # Check WoL-related registry entries
-                                    wol_support["wol_config_notes"].append("Network adapter found in registry")
-                                    break
-                            except FileNotFoundError:
-                                continue
-                    except Exception:
-                        continue
-        except Exception as reg_error:
-            wol_support["wol_config_notes"].append(f"Registry check failed: {reg_error}")
-
-        # Run netsh command to get detailed adapter information
-        try:
-            netsh_output = subprocess.check_output(
-                f'netsh interface ipv4 show config name="{interface}"', 
-                shell=True, 
-                stderr=subprocess.STDOUT, 
-                universal_newlines=True
-            )
+        if reg_map is None:
+            reg_map = _load_wol_registry_map()
+        wol_support["wol_config_notes"].extend(reg_map.get(interface.lower(), []))
+
+        # Look the interface up in the shared netsh dump
+        if netsh_map is None:
+            netsh_map = _load_netsh_config_map()
+        if interface.lower() in netsh_map:
             wol_support["wol_config_notes"].append("Netsh configuration retrieved")
-        except subprocess.CalledProcessError as netsh_error:
-            wol_support["wol_config_notes"].append(f"Netsh error: {netsh_error}")
 
     except Exception as e:
         wol_support["wol_config_notes"].append(f"Unexpected error: {e}")
@@ -115,81 +416,243 @@ def check_windows_wol_support(interface):
 
     return wol_support
 
+# Single worker keeps config writes ordered without blocking the caller;
+# the snapshot is only a UI cache, so nothing needs to wait on the disk
+_config_writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+def _write_config_file(config_file, network_info):
+    """Serialize network_info to config_file via an atomic tmp-file swap."""
+    tmp_file = config_file + '.tmp'
+
+    try:
+        if orjson is not None:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(network_info, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, 'w') as f:
+                json.dump(network_info, f, indent=4)
+
+        # Readers never observe a partially written file
+        os.replace(tmp_file, config_file)
+        print(f"Wake-on-LAN configuration saved to {config_file}")
+    except Exception as e:
+        print(f"Failed to generate configuration file: {e}")
+
 def generate_wol_configuration_file(network_info):
     """
     Generate a comprehensive configuration file for Wake-on-LAN.
+
+    The write happens on a background worker so callers (including request
+    handlers) return immediately; the file itself is swapped in atomically.
     """
     config_file = 'wol_config.json'
-    
+
     try:
-        with open(config_file, 'w') as f:
-            json.dump(network_info, f, indent=4)
-        
-        print(f"Wake-on-LAN configuration saved to {config_file}")
+        _config_writer.submit(_write_config_file, config_file, network_info)
         return config_file
     except Exception as e:
         print(f"Failed to generate configuration file: {e}")
         return None
 
-def send_wol_packet(mac_address, broadcast="255.255.255.255", port=9):
+# Shared broadcast socket reused across sends. sendto on a UDP socket is a
+# single atomic syscall, but lazy creation needs the lock under Flask's
+# threaded server.
+_wol_sock = None
+_wol_sock_lock = threading.Lock()
+
+def _get_wol_socket():
+    """Return the shared broadcast UDP socket, creating it on first use."""
+    global _wol_sock
+
+    with _wol_sock_lock:
+        if _wol_sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            # Don't loop sent packets back to local listeners (e.g. the
+            # monitor) when the target is a multicast group
+            try:
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
+            except OSError:
+                pass
+            _wol_sock = sock
+        return _wol_sock
+
+# Strips every accepted MAC separator in a single pass, replacing the
+# chained .replace() calls (one throwaway string each)
+_MAC_TRANS = str.maketrans('', '', ':-. ')
+
+@functools.lru_cache(maxsize=256)
+def _build_magic_packet(mac_address):
+    """
+    Build (and cache) the 102-byte magic packet for a MAC address.
+
+    Repeated wakes of the same machine hit the cache instead of re-parsing
+    the MAC and re-concatenating the packet.
+    """
+    # Remove any separators from MAC address and convert to bytes
+    mac_bytes = bytes.fromhex(mac_address.translate(_MAC_TRANS))
+    if len(mac_bytes) != 6:
+        raise ValueError(f"Invalid MAC address: {mac_address}")
+
+    # Magic packet: 6 bytes of 0xFF followed by MAC address repeated 16
+    # times, written into one preallocated buffer instead of concatenating
+    # intermediate bytes objects (only runs on a cache miss)
+    buf = bytearray(102)
+    buf[0:6] = b'\xFF' * 6
+    mv = memoryview(buf)
+    for i in range(16):
+        mv[6 + i * 6:12 + i * 6] = mac_bytes
+    return bytes(buf)
+
+def _sendmmsg_batch(sock, datagrams):
+    """
+    Send many UDP datagrams in one syscall via Linux sendmmsg(2).
+
+    datagrams is a sequence of (payload, (address, port)) pairs. Returns
+    the number of datagrams transmitted, or None when sendmmsg isn't
+    available (non-Linux, missing libc symbol, or call failure) so callers
+    can fall back to a plain sendto loop.
+    """
+    if platform.system() != 'Linux':
+        return None
+
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL('libc.so.6', use_errno=True)
+        sendmmsg = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+
+    class iovec(ctypes.Structure):
+        _fields_ = [("iov_base", ctypes.c_void_p),
+                    ("iov_len", ctypes.c_size_t)]
+
+    class sockaddr_in(ctypes.Structure):
+        # Port and address are kept as raw byte arrays so network byte
+        # order is explicit instead of depending on host endianness
+        _fields_ = [("sin_family", ctypes.c_ushort),
+                    ("sin_port", ctypes.c_ubyte * 2),
+                    ("sin_addr", ctypes.c_ubyte * 4),
+                    ("sin_zero", ctypes.c_ubyte * 8)]
+
+    class msghdr(ctypes.Structure):
+        _fields_ = [("msg_name", ctypes.c_void_p),
+                    ("msg_namelen", ctypes.c_uint32),
+                    ("msg_iov", ctypes.POINTER(iovec)),
+                    ("msg_iovlen", ctypes.c_size_t),
+                    ("msg_control", ctypes.c_void_p),
+                    ("msg_controllen", ctypes.c_size_t),
+                    ("msg_flags", ctypes.c_int)]
+
+    class mmsghdr(ctypes.Structure):
+        _fields_ = [("msg_hdr", msghdr),
+                    ("msg_len", ctypes.c_uint)]
+
+    try:
+        count = len(datagrams)
+        msgs = (mmsghdr * count)()
+        keepalive = []  # hold ctypes buffers until the syscall returns
+
+        for i, (payload, (address, port)) in enumerate(datagrams):
+            buf = ctypes.create_string_buffer(payload, len(payload))
+            iov = (iovec * 1)()
+            iov[0].iov_base = ctypes.cast(buf, ctypes.c_void_p)
+            iov[0].iov_len = len(payload)
+
+            sa = sockaddr_in()
+            sa.sin_family = socket.AF_INET
+            sa.sin_port[:] = port.to_bytes(2, 'big')
+            sa.sin_addr[:] = socket.inet_aton(address)
+
+            msgs[i].msg_hdr.msg_name = ctypes.cast(
+                ctypes.pointer(sa), ctypes.c_void_p)
+            msgs[i].msg_hdr.msg_namelen = ctypes.sizeof(sa)
+            msgs[i].msg_hdr.msg_iov = iov
+            msgs[i].msg_hdr.msg_iovlen = 1
+
+            keepalive.append((buf, iov, sa))
+
+        sent = sendmmsg(sock.fileno(), msgs, count, 0)
+        if sent < 0:
+            return None
+        return sent
+    except Exception:
+        return None
+
+def send_wol_packet(mac_address, broadcast="255.255.255.255", port=9,
+                    wait_for_response=False, verbose=False):
     """
     Send a Wake-on-LAN packet to the specified MAC address.
-    
+
     Args:
         mac_address (str): The MAC address of the target machine
         broadcast (str): The broadcast address to use (default: 255.255.255.255)
         port (int): The port to send the magic packet to (default: 9)
+        wait_for_response (bool): Listen briefly for a reply after sending.
+            WoL is fire-and-forget and target NICs do not answer, so this is
+            off by default; enable only for debugging.
+        verbose (bool): Print the collected log (including the packet
+            structure breakdown) to stdout. Off by default so the hot path
+            skips the extra string formatting.
+
+    Returns:
+        tuple: (success, log_lines). Callers that surface diagnostics (like
+        the /wake route) join log_lines instead of capturing stdout.
     """
-    print(f"\n=== Wake-on-LAN Packet Details ===")
-    print(f"Target MAC: {mac_address}")
-    print(f"Broadcast Address: {broadcast}")
-    print(f"Port: {port}")
-    
+    log = [
+        "=== Wake-on-LAN Packet Details ===",
+        f"Target MAC: {mac_address}",
+        f"Broadcast Address: {broadcast}",
+        f"Port: {port}",
+    ]
+
     try:
-        # Remove any separators from MAC address and convert to bytes
-        mac_bytes = bytes.fromhex(mac_address.replace(':', '').replace('-', ''))
-        
-        # Create magic packet: 6 bytes of 0xFF followed by MAC address repeated 16 times
-        magic_packet = b'\xFF' * 6 + mac_bytes * 16
-        
-        print(f"Magic Packet Size: {len(magic_packet)} bytes")
-        print("Magic Packet Structure:")
-        print(f"- Synchronization Stream: {' '.join([f'{b:02x}' for b in magic_packet[:6]])}")
-        print(f"- Target MAC (First Copy): {' '.join([f'{b:02x}' for b in magic_packet[6:12]])}")
-        
-        # Create UDP socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        
-        print("\nSending packet...")
+        magic_packet = _build_magic_packet(mac_address)
+
+        if verbose:
+            # The packet-structure breakdown is debug-only; the hex
+            # formatting is not worth paying for on every send
+            log.append(f"Magic Packet Size: {len(magic_packet)} bytes")
+            log.append("Magic Packet Structure:")
+            log.append(f"- Synchronization Stream: {magic_packet[:6].hex(' ')}")
+            log.append(f"- Target MAC (First Copy): {magic_packet[6:12].hex(' ')}")
+
+        # Reuse the shared broadcast UDP socket
+        sock = _get_wol_socket()
+
         # Send magic packet
         sock.sendto(magic_packet, (broadcast, port))
-        print(f"✓ Packet sent successfully to {broadcast}:{port}")
-        
-        # Try to set up a receiving socket to check for any response
-        try:
-            recv_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            recv_socket.settimeout(2)  # 2 second timeout
-            recv_socket.bind(('', port))
-            print("\nListening for response...")
-            
+        log.append(f"✓ Packet sent successfully to {broadcast}:{port}")
+
+        # Optionally listen for a reply; skipped by default since WoL
+        # targets never respond and the wait blocks the caller
+        if wait_for_response:
             try:
-                data, addr = recv_socket.recvfrom(1024)
-                print(f"← Received response from {addr}")
-                print(f"Response data: {data.hex()}")
-            except socket.timeout:
-                print("× No response received (timeout)")
-            
-            recv_socket.close()
-        except Exception as e:
-            print(f"Note: Could not set up response monitoring: {e}")
-        
-        sock.close()
-        return True
-        
+                recv_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                recv_socket.settimeout(2)  # 2 second timeout
+                recv_socket.bind(('', port))
+                log.append("Listening for response...")
+
+                try:
+                    data, addr = recv_socket.recvfrom(1024)
+                    log.append(f"← Received response from {addr}")
+                    log.append(f"Response data: {data.hex()}")
+                except socket.timeout:
+                    log.append("× No response received (timeout)")
+
+                recv_socket.close()
+            except Exception as e:
+                log.append(f"Note: Could not set up response monitoring: {e}")
+
+        if verbose:
+            print('\n' + '\n'.join(log))
+        return True, log
+
     except Exception as e:
+        log.append(f"× Error sending WoL packet: {e}")
         print(f"\n× Error sending WoL packet: {e}")
-        return False
+        return False, log
 
 def main():
     # Retrieve network information
@@ -219,9 +682,8 @@ def main():
 if __name__ == "__main__":
     network_info = get_comprehensive_network_info()
     # Save network info to JSON for the web app
-    with open("wol_config.json", "w") as f:
-        json.dump(network_info, f, indent=4)
+    generate_wol_configuration_file(network_info)
 
     # Example: Send WoL packet (replace with your target MAC and broadcast address)
     target_mac = "2c:4d:54:cf:f7:c1"  # Replace with the correct MAC address
-    send_wol_packet(target_mac, "192.168.3.255") # Replace with your broadcast address if needed
+    send_wol_packet(target_mac, "192.168.3.255", verbose=True) # Replace with your broadcast address if needed
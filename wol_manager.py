@@ -16,31 +16,313 @@ Features:
 - BIOS/UEFI setup guide
 """
 
+import base64
+import functools
+import hashlib
 import json
 import os
 import platform
+import queue
+import re
+import selectors
 import socket
 import subprocess
 import sys
 import threading
 import time
-import winreg
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request
-import netifaces
-import psutil
 
-# Flask application
-app = Flask(__name__)
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Registry access is Windows-only; everything else (send, monitor, menu)
+# works fine without it. psutil/flask are imported inside the functions
+# that need them so a bare CLI start doesn't pay for them.
+if _IS_WINDOWS:
+    import winreg
+
+# orjson is optional: the C serializer speeds up the network-info dump and
+# the web API, but everything falls back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Registry class key that holds one subkey per network adapter
+NET_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4D36E972-E325-11CE-BFC1-08002bE10318}"
+
+# Registry network key mapping adapter GUIDs to their connection names
+# ("Ethernet", "Local Area Connection") via each Connection subkey
+NET_CONNECTIONS_KEY = r"SYSTEM\CurrentControlSet\Control\Network\{4D36E972-E325-11CE-BFC1-08002BE10318}"
+
+# Interfaces that can never receive a WoL packet; skipped before any
+# address or registry lookup is spent on them. Bare loopback names are
+# matched exactly — a 'lo' prefix would also swallow "Local Area
+# Connection", the stock wired-adapter name on Windows
+_LOOPBACK_NAMES = frozenset({'lo', 'lo0'})
+_PSEUDO_PREFIXES = ('loopback', 'isatap', 'teredo', 'docker', 'veth')
+
+# Magic packet synchronization stream: six 0xFF bytes
+_SYNC = b'\xFF' * 6
+
+# Tokens check_wol_configuration looks for in PowerShell output; one
+# compiled pattern scans each report in a single pass
+_WOL_DIAG_RE = re.compile(r'(Disabled|Wi-?Fi|Wireless)')
+
+# Static PowerShell scripts, built once at import. All of them run through
+# _run_ps, which passes them as an -EncodedCommand so multi-line scripts
+# survive the command line without any quoting games.
+
+_PS_ADAPTER_PM_SCRIPT = """
+Get-NetAdapter | Where-Object {$_.Status -eq 'Up'} | ForEach-Object {
+    $adapter = $_
+    $pm = Get-NetAdapterPowerManagement -Name $adapter.Name
+    Write-Output "Adapter: $($adapter.Name)"
+    Write-Output "WakeOnMagicPacket: $($pm.WakeOnMagicPacket)"
+    Write-Output "WakeOnPattern: $($pm.WakeOnPattern)"
+    Write-Output "DeviceSleepOnDisconnect: $($pm.DeviceSleepOnDisconnect)"
+}
+"""
+
+_PS_CONNECTION_TYPE_SCRIPT = """
+Get-NetAdapter | Where-Object {$_.Status -eq 'Up'} | Select-Object Name, InterfaceDescription, MediaType
+"""
+
+_PS_BIOS_FALLBACK_SCRIPT = (
+    "Get-WmiObject -Class Win32_BIOS | "
+    "Format-List Manufacturer,Name,Version,SerialNumber"
+)
+
+# Combined BIOS/power/wake report: each block writes a section marker that
+# check_bios_settings splits on afterwards
+_PS_BIOS_CHECK_SCRIPT = """
+Write-Output '---SECTION:POWER---'
+Write-Output "Current Power Scheme: $(powercfg /getactivescheme)"
+Write-Output "`nNetwork Adapter Settings:"
+$adapters = Get-NetAdapter | Where-Object {$_.Status -eq 'Up'}
+foreach ($adapter in $adapters) {
+    Write-Output "`nAdapter: $($adapter.Name)"
+    Write-Output "Status: $($adapter.Status)"
+    Write-Output "Media Type: $($adapter.MediaType)"
+    Write-Output "Interface Description: $($adapter.InterfaceDescription)"
+
+    # Check registry for Wake-on-LAN settings
+    $adapterRegPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Class\\{4d36e972-e325-11ce-bfc1-08002be10318}"
+    Get-ChildItem $adapterRegPath | ForEach-Object {
+        $regPath = $_.PSPath
+        $description = (Get-ItemProperty -Path $regPath).DriverDesc
+        if ($description -eq $adapter.InterfaceDescription) {
+            $wolMagicPacket = (Get-ItemProperty -Path $regPath).WolMagicPacket
+            $pmARPOffload = (Get-ItemProperty -Path $regPath).PMARPOffload
+            $pmNSOffload = (Get-ItemProperty -Path $regPath).PMNSOffload
+            $pmWakeOnPattern = (Get-ItemProperty -Path $regPath).WakeOnPattern
+
+            Write-Output "`nWake-on-LAN Settings:"
+            Write-Output "  Wake on Magic Packet: $wolMagicPacket"
+            Write-Output "  PM ARP Offload: $pmARPOffload"
+            Write-Output "  PM NS Offload: $pmNSOffload"
+            Write-Output "  Wake on Pattern: $pmWakeOnPattern"
+        }
+    }
+    Write-Output "-----------------"
+}
+
+Write-Output '---SECTION:WAKE---'
+Write-Output "Devices that can wake the system:"
+$wakeDevices = powercfg /devicequery wake_armed
+$wakeDevices | ForEach-Object {
+    Write-Output "  * $_"
+}
+
+Write-Output "`nPower Settings Status:"
+# Check if Fast Startup is enabled
+$fastStartup = Get-ItemProperty "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Power" -Name HiberbootEnabled -ErrorAction SilentlyContinue
+Write-Output "  Fast Startup: $(if ($fastStartup.HiberbootEnabled -eq 1) { 'Enabled' } else { 'Disabled' })"
+
+# Check network adapter wake settings
+Write-Output "`nNetwork Adapter Wake Status:"
+Get-WmiObject MSPower_DeviceWakeEnable -Namespace root/wmi | ForEach-Object {
+    $status = if ($_.Enable) { "Enabled" } else { "Disabled" }
+    Write-Output "  * Wake capability: $status"
+}
+"""
+
+_PS_CONFIGURE_WOL_SCRIPT = """
+# Get the network adapter
+$adapter = Get-NetAdapter | Where-Object {$_.Status -eq 'Up' -and $_.MediaType -eq '802.3'}
+
+if ($adapter) {
+    Write-Output "Configuring adapter: $($adapter.Name)"
+
+    # Enable WoL in power management
+    $devicePath = $adapter.PnPDeviceID
+    $device = Get-PnpDevice | Where-Object { $_.InstanceId -eq $devicePath }
+
+    # Registry path for the network adapter
+    $adapterId = ($adapter.InterfaceDescription -replace '[^a-zA-Z0-9]', '_')
+    $regPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Class\\{4d36e972-e325-11ce-bfc1-08002be10318}"
+
+    Get-ChildItem $regPath | ForEach-Object {
+        $instancePath = $_.PSPath
+        if ((Get-ItemProperty -Path $instancePath).DriverDesc -eq $adapter.InterfaceDescription) {
+            # Enable WoL settings
+            Set-ItemProperty -Path $instancePath -Name "WolMagicPacket" -Value 1
+            Set-ItemProperty -Path $instancePath -Name "WakeOnMagicPacket" -Value 1
+            Set-ItemProperty -Path $instancePath -Name "PMARPOffload" -Value 1
+            Set-ItemProperty -Path $instancePath -Name "PMNSOffload" -Value 1
+            Set-ItemProperty -Path $instancePath -Name "WakeOnPattern" -Value 1
+            Write-Output "Enabled Wake-on-LAN registry settings"
+        }
+    }
+
+    # Enable device to wake computer
+    $powerMgmt = Get-WmiObject MSPower_DeviceWakeEnable -Namespace root\\wmi |
+        Where-Object { $_.InstanceName -match $adapterId }
+    if ($powerMgmt) {
+        $powerMgmt.Enable = $true
+        $powerMgmt.Put()
+    }
+
+    # Disable Fast Startup
+    $regPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Power"
+    Set-ItemProperty -Path $regPath -Name "HiberbootEnabled" -Value 0
+    Write-Output "Disabled Fast Startup"
+
+    # Configure Power Settings
+    # Prevent sleep when plugged in
+    powercfg /change standby-timeout-ac 0
+
+    # Enable wake timers
+    powercfg /setacvalueindex scheme_current sub_buttons pbuttonaction 0
+    powercfg /setacvalueindex scheme_current sub_none wakefromlan 1
+    powercfg /setactive scheme_current
+
+    Write-Output "Power settings configured successfully"
+} else {
+    Write-Output "No suitable network adapter found"
+}
+"""
+
+
+# Whether the console accepts ANSI escapes; decided on first clear
+_vt_enabled = None
+
+
+def _clear_screen():
+    """Clear the console with an ANSI escape instead of spawning a shell.
+
+    os.system('cls'/'clear') forks a whole process per menu redraw. On
+    Windows, VT processing is switched on once via SetConsoleMode; if that
+    fails (old console), fall back to the shell command.
+    """
+    global _vt_enabled
+    if _vt_enabled is None:
+        if os.name == 'nt':
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+                mode = ctypes.c_uint32()
+                ok = kernel32.GetConsoleMode(handle, ctypes.byref(mode))
+                # 0x0004 = ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                _vt_enabled = bool(ok and kernel32.SetConsoleMode(
+                    handle, mode.value | 0x0004))
+            except Exception:
+                _vt_enabled = False
+        else:
+            _vt_enabled = True
+
+    if _vt_enabled:
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+
+def _pause(prompt="\nPress Enter to continue..."):
+    """Wait for Enter without blocking other threads' console output.
+
+    input() holds the readline machinery for the whole wait; sleeping in
+    select (POSIX) or polling msvcrt (Windows) instead lets the monitor
+    thread keep printing packet lines while the menu waits.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    if os.name == 'nt':
+        import msvcrt
+        while True:
+            if msvcrt.kbhit():
+                if msvcrt.getwch() in ('\r', '\n'):
+                    break
+            else:
+                time.sleep(0.05)
+    else:
+        import select
+        while True:
+            ready, _, _ = select.select([sys.stdin], [], [], 0.25)
+            if ready:
+                sys.stdin.readline()
+                break
+
+
+def _run_ps(script, check=False):
+    """Run a PowerShell script with profile loading and prompts disabled.
+
+    -NoProfile skips $PROFILE (often the slowest part of a PowerShell
+    start), and -EncodedCommand carries the script as base64 UTF-16LE so
+    arbitrary quoting and newlines pass through untouched.
+    """
+    encoded = base64.b64encode(script.encode('utf-16-le')).decode('ascii')
+    # Explicit utf-8 with replacement decodes the output exactly once;
+    # CREATE_NO_WINDOW stops a console window flashing up per call
+    creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    return subprocess.run(
+        ["powershell", "-NoProfile", "-NonInteractive",
+         "-ExecutionPolicy", "Bypass", "-EncodedCommand", encoded],
+        capture_output=True, encoding='utf-8', errors='replace',
+        creationflags=creationflags, check=check)
 
 class WoLManager:
     def __init__(self):
         self.monitor_thread = None
         self.web_thread = None
         self.is_monitoring = False
+        self._monitor_wakeup = None
+        # Short-TTL cache: the menu re-reads network info on several
+        # choices and every web request hits it too
+        self._netinfo_cache = None
+        self._netinfo_ts = 0.0
+        self._netinfo_ttl = 5.0
+        # NetCfgInstanceId -> registry subkey name, built on first use
+        self._netcfg_index = None
+        # Pool of preconfigured broadcast sockets, filled on the first send;
+        # concurrent /wake requests each check one out instead of racing
+        # over a single socket or creating their own
+        self._send_pool = None
+        self._send_pool_lock = threading.Lock()
+        # Background refresher keeps the cache warm for the web interface
+        # and maintains an ETag over the current snapshot
+        self._snapshot_thread = None
+        self._snapshot_etag = None
+        # Cached WMI connection (pywin32), created on first use
+        self._wmi = None
+
+    def invalidate_network_info(self):
+        """Drop the cached network info after adapter settings change."""
+        self._netinfo_cache = None
+
+    def get_network_info(self, include_down=False):
+        """Get comprehensive network information (cached for a few seconds).
+
+        Loopback and pseudo interfaces are always skipped; interfaces that
+        are administratively down are skipped too unless include_down is set.
+        """
+        # The cache only covers the default (include_down=False) view
+        if (not include_down and self._netinfo_cache is not None
+                and time.monotonic() - self._netinfo_ts < self._netinfo_ttl):
+            return self._netinfo_cache
+
+        import psutil
 
-    def get_network_info(self):
-        """Get comprehensive network information."""
         network_info = {
             "system": {
                 "os": platform.system(),
@@ -50,20 +332,43 @@ class WoLManager:
             "network_interfaces": []
         }
 
-        interfaces = netifaces.interfaces()
-        for interface in interfaces:
+        # net_if_stats returns every interface at once; one call up front
+        # replaces the per-interface lookup (interfaces appearing mid-scan
+        # are simply reported as down until the next refresh)
+        try:
+            stats = psutil.net_if_stats()
+        except Exception:
+            stats = {}
+
+        # Warm the adapter index before the loop: one registry walk serves
+        # every check_wol_support call below as a plain dict lookup
+        if _IS_WINDOWS and self._netcfg_index is None:
+            self._netcfg_index = self._build_netcfg_index()
+
+        # net_if_addrs returns MAC + IPv4 for every interface from a single
+        # enumeration; with net_if_stats above that is two syscall dumps for
+        # the whole scan instead of per-interface ifaddresses calls
+        addrs = psutil.net_if_addrs()
+        for interface, addr_list in addrs.items():
             try:
-                mac_info = netifaces.ifaddresses(interface).get(netifaces.AF_LINK, [{}])[0]
-                mac_address = mac_info.get('addr', 'N/A')
-                
-                ipv4_info = netifaces.ifaddresses(interface).get(netifaces.AF_INET, [])
-                ipv4 = ipv4_info[0]['addr'] if ipv4_info else 'N/A'
-                
-                try:
-                    stats = psutil.net_if_stats()
-                    is_up = interface in stats and stats[interface].isup
-                except Exception:
-                    is_up = False
+                # Filter before the address lookups: loopback/pseudo
+                # adapters can't be woken, and down interfaces are only
+                # interesting when explicitly asked for
+                name_lower = interface.lower()
+                if (name_lower in _LOOPBACK_NAMES
+                        or name_lower.startswith(_PSEUDO_PREFIXES)):
+                    continue
+
+                is_up = interface in stats and stats[interface].isup
+                if not is_up and not include_down:
+                    continue
+
+                mac_address = next(
+                    (a.address for a in addr_list if a.family == psutil.AF_LINK),
+                    'N/A')
+                ipv4 = next(
+                    (a.address for a in addr_list if a.family == socket.AF_INET),
+                    'N/A')
 
                 interface_details = {
                     "name": interface,
@@ -72,7 +377,7 @@ class WoLManager:
                     "is_up": is_up
                 }
 
-                if platform.system() == 'Windows':
+                if _IS_WINDOWS:
                     interface_details.update(self.check_wol_support(interface))
 
                 network_info["network_interfaces"].append(interface_details)
@@ -80,108 +385,312 @@ class WoLManager:
             except Exception as e:
                 print(f"Error processing interface {interface}: {e}")
 
+        if not include_down:
+            self._netinfo_cache = network_info
+            self._netinfo_ts = time.monotonic()
         return network_info
 
-    def check_wol_support(self, interface):
-        """Check Wake-on-LAN support for a network interface."""
-        wol_support = {
-            "wol_support": False,
-            "wol_settings": []
-        }
+    # Registry value names check_wol_support reports on
+    _WOL_VALUE_NAMES = frozenset({"*WakeOnMagicPacket", "PMESupported"})
+
+    def _build_netcfg_index(self):
+        """Map adapter names (lower-cased) to their cached WoL values.
+
+        One walk of the network class key collects the subkey name and the
+        (DWORD-typed) WoL values for every adapter, so check_wol_support
+        becomes a pure dict lookup with no registry IO per interface.
+        Entries are keyed both by NetCfgInstanceId GUID and by the
+        connection's friendly name ("Ethernet") — psutil enumerates
+        interfaces by the latter. The index is dropped whenever adapter
+        settings change.
+        """
+        index = {}
 
         try:
-            # Check registry for network adapter settings
-            key_path = r"SYSTEM\CurrentControlSet\Control\Class\{4D36E972-E325-11CE-BFC1-08002bE10318}"
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, NET_CLASS_KEY) as key:
                 for i in range(winreg.QueryInfoKey(key)[0]):
                     try:
                         subkey_name = winreg.EnumKey(key, i)
                         with winreg.OpenKey(key, subkey_name) as subkey:
-                            try:
-                                # Check if this is the right network adapter
-                                net_cfg_instance_id = winreg.QueryValueEx(subkey, "NetCfgInstanceId")[0]
-                                if net_cfg_instance_id.lower() == interface.lower():
-                                    # Check WoL-related registry values
-                                    try:
-                                        wol_magic = winreg.QueryValueEx(subkey, "*WakeOnMagicPacket")[0]
-                                        wol_support["wol_settings"].append(
-                                            f"Wake on Magic Packet: {'Enabled' if wol_magic == 1 else 'Disabled'}")
-                                    except:
-                                        pass
-
-                                    try:
-                                        pme_support = winreg.QueryValueEx(subkey, "PMESupported")[0]
-                                        wol_support["wol_settings"].append(
-                                            f"PME Support: {'Yes' if pme_support == 1 else 'No'}")
-                                    except:
-                                        pass
-
-                                    wol_support["wol_support"] = True
-                                    break
-                            except:
-                                continue
-                    except:
+                            instance_id = None
+                            values = {}
+                            for j in range(winreg.QueryInfoKey(subkey)[1]):
+                                name, value, reg_type = winreg.EnumValue(subkey, j)
+                                if name == "NetCfgInstanceId":
+                                    instance_id = value
+                                elif (name in self._WOL_VALUE_NAMES
+                                        and reg_type == winreg.REG_DWORD):
+                                    values[name] = value
+                            if instance_id:
+                                index[instance_id.lower()] = (subkey_name, values)
+                    except OSError:
                         continue
-        except Exception as e:
-            wol_support["wol_settings"].append(f"Error checking registry: {e}")
+        except Exception:
+            pass
 
+        # Second walk: alias each GUID entry under its connection name so
+        # lookups by the friendly name psutil reports also hit
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                                NET_CONNECTIONS_KEY) as key:
+                for i in range(winreg.QueryInfoKey(key)[0]):
+                    try:
+                        guid = winreg.EnumKey(key, i)
+                        entry = index.get(guid.lower())
+                        if entry is None:
+                            continue
+                        with winreg.OpenKey(key, guid + r"\Connection") as conn:
+                            name, _ = winreg.QueryValueEx(conn, "Name")
+                        if name:
+                            index[name.lower()] = entry
+                    except OSError:
+                        continue
+        except Exception:
+            pass
+
+        return index
+
+    @staticmethod
+    def _read_dword(subkey, name):
+        """Read a registry value, returning None unless it is a REG_DWORD.
+
+        Some drivers ship WoL flags with unexpected types; filtering by
+        type up front beats catching the resulting exceptions later.
+        """
+        try:
+            value, reg_type = winreg.QueryValueEx(subkey, name)
+        except OSError:
+            return None
+        return value if reg_type == winreg.REG_DWORD else None
+
+    def check_wol_support(self, interface):
+        """Check Wake-on-LAN support for a network interface."""
+        wol_support = {
+            "wol_support": False,
+            "wol_settings": []
+        }
+
+        if not _IS_WINDOWS:
+            return wol_support
+
+        if self._netcfg_index is None:
+            self._netcfg_index = self._build_netcfg_index()
+
+        entry = self._netcfg_index.get(interface.lower())
+        if entry is None:
+            return wol_support
+
+        # The values were read (with type filtering) during the index walk;
+        # this is now a pure dict lookup
+        _, values = entry
+        if "*WakeOnMagicPacket" in values:
+            wol_support["wol_settings"].append(
+                f"Wake on Magic Packet: {'Enabled' if values['*WakeOnMagicPacket'] == 1 else 'Disabled'}")
+        if "PMESupported" in values:
+            wol_support["wol_settings"].append(
+                f"PME Support: {'Yes' if values['PMESupported'] == 1 else 'No'}")
+
+        wol_support["wol_support"] = True
         return wol_support
 
+    def _enable_wol_wmi(self, interface_name):
+        """Enable device wake through WMI directly, staying in-process.
+
+        Talks to MSPower_DeviceWakeEnable over a cached COM connection
+        instead of paying a PowerShell cold start per adapter. Raises
+        ImportError when pywin32 isn't installed.
+        """
+        import win32com.client
+        if self._wmi is None:
+            self._wmi = win32com.client.GetObject(r"winmgmts:\\.\root\wmi")
+        # WQL escapes embedded quotes with a backslash, not SQL-style ''
+        query = ("SELECT * FROM MSPower_DeviceWakeEnable WHERE InstanceName LIKE '%"
+                 + interface_name.replace("'", "\\'") + "%'")
+        matched = False
+        for device in self._wmi.ExecQuery(query):
+            device.Enable = True
+            device.Put_()
+            matched = True
+        return matched
+
     def enable_wol_adapter(self, interface_name):
         """Enable Wake-on-LAN for a network adapter."""
         try:
-            # Use PowerShell to enable WoL
-            ps_command = f"""
-            $adapter = Get-NetAdapter | Where-Object {{$_.InterfaceDescription -like '*{interface_name}*'}}
-            $adapter | Set-NetAdapterPowerManagement -WakeOnMagicPacket Enabled
-            """
-            subprocess.run(["powershell", "-Command", ps_command], check=True)
+            try:
+                enabled = self._enable_wol_wmi(interface_name)
+            except ImportError:
+                enabled = False
+            if not enabled:
+                # PowerShell fallback: pywin32 missing, or no WMI instance
+                # matched the adapter
+                ps_command = f"""
+                $adapter = Get-NetAdapter | Where-Object {{$_.InterfaceDescription -like '*{interface_name}*'}}
+                $adapter | Set-NetAdapterPowerManagement -WakeOnMagicPacket Enabled
+                """
+                _run_ps(ps_command, check=True)
+            self.invalidate_network_info()
+            self._netcfg_index = None
             return True, "Wake-on-LAN enabled successfully"
         except Exception as e:
             return False, f"Failed to enable Wake-on-LAN: {e}"
 
-    def send_wol_packet(self, mac_address, broadcast="255.255.255.255", port=9):
+    def _snapshot_refresh_loop(self):
+        """Refresh the network snapshot on a fixed cadence.
+
+        Web requests then always hit the cache — the enumeration rate is
+        pinned to the TTL, not the request rate — and the ETag lets
+        browsers skip the body entirely when nothing changed.
+        """
+        while True:
+            try:
+                self.invalidate_network_info()
+                info = self.get_network_info()
+                payload = json.dumps(info, sort_keys=True).encode()
+                self._snapshot_etag = hashlib.md5(payload).hexdigest()
+            except Exception:
+                pass
+            time.sleep(self._netinfo_ttl)
+
+    def start_snapshot_refresh(self):
+        """Start the background snapshot refresher (idempotent)."""
+        if self._snapshot_thread is None or not self._snapshot_thread.is_alive():
+            self._snapshot_thread = threading.Thread(
+                target=self._snapshot_refresh_loop, daemon=True)
+            self._snapshot_thread.start()
+
+    _SEND_POOL_SIZE = 4
+
+    @staticmethod
+    def _new_bcast_sock():
+        """Create one preconfigured broadcast socket."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        # Don't loop sent packets back to local listeners (e.g. the
+        # monitor) when the target is a multicast group
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
+        except OSError:
+            pass
+        return sock
+
+    def _get_send_pool(self):
+        """Return the send-socket pool, filling it on first use."""
+        with self._send_pool_lock:
+            if self._send_pool is None:
+                pool = queue.Queue()
+                for _ in range(self._SEND_POOL_SIZE):
+                    pool.put(self._new_bcast_sock())
+                self._send_pool = pool
+            return self._send_pool
+
+    def close(self):
+        """Release the pooled broadcast sockets."""
+        with self._send_pool_lock:
+            if self._send_pool is not None:
+                while True:
+                    try:
+                        self._send_pool.get_nowait().close()
+                    except queue.Empty:
+                        break
+                self._send_pool = None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_magic_packet(mac_address):
+        """Build (and memoize) the 102-byte magic packet for a MAC address."""
+        mac_bytes = bytes.fromhex(mac_address.replace(':', '').replace('-', ''))
+        if len(mac_bytes) != 6:
+            raise ValueError(f"Invalid MAC address: {mac_address}")
+        # Fill one preallocated buffer instead of concatenating temporaries;
+        # only runs on a cache miss
+        buf = bytearray(102)
+        buf[0:6] = _SYNC
+        mv = memoryview(buf)
+        for i in range(16):
+            mv[6 + i * 6:12 + i * 6] = mac_bytes
+        return bytes(buf)
+
+    def send_wol_packet(self, mac_address, broadcast="255.255.255.255", port=9,
+                        verbose=False):
         """Send a Wake-on-LAN packet."""
-        print(f"\n=== Wake-on-LAN Packet Details ===")
-        print(f"Target MAC: {mac_address}")
-        print(f"Broadcast Address: {broadcast}")
-        print(f"Port: {port}")
-        
+        if verbose:
+            print(f"\n=== Wake-on-LAN Packet Details ===")
+            print(f"Target MAC: {mac_address}")
+            print(f"Broadcast Address: {broadcast}")
+            print(f"Port: {port}")
+
         try:
-            mac_bytes = bytes.fromhex(mac_address.replace(':', '').replace('-', ''))
-            magic_packet = b'\xFF' * 6 + mac_bytes * 16
-            
-            print(f"Magic Packet Size: {len(magic_packet)} bytes")
-            print("Magic Packet Structure:")
-            print(f"- Synchronization Stream: {' '.join([f'{b:02x}' for b in magic_packet[:6]])}")
-            print(f"- Target MAC (First Copy): {' '.join([f'{b:02x}' for b in magic_packet[6:12]])}")
-            
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            
-            print("\nSending packet...")
-            sock.sendto(magic_packet, (broadcast, port))
+            # Repeat wakes for the same machine skip the parse/concat work
+            magic_packet = self._build_magic_packet(mac_address)
+
+            if verbose:
+                print(f"Magic Packet Size: {len(magic_packet)} bytes")
+                print("Magic Packet Structure:")
+                print(f"- Synchronization Stream: {magic_packet[:6].hex(' ')}")
+                print(f"- Target MAC (First Copy): {magic_packet[6:12].hex(' ')}")
+                print("\nSending packet...")
+
+            # Check a socket out of the pool for the send; a socket that
+            # errors is assumed broken and replaced before going back
+            pool = self._get_send_pool()
+            sock = pool.get()
+            try:
+                try:
+                    sock.sendto(magic_packet, (broadcast, port))
+                except OSError:
+                    try:
+                        sock.close()
+                    except OSError:
+                        pass
+                    sock = self._new_bcast_sock()
+                    sock.sendto(magic_packet, (broadcast, port))
+            finally:
+                pool.put(sock)
             print(f"✓ Packet sent successfully to {broadcast}:{port}")
-            sock.close()
             return True
-            
+
         except Exception as e:
             print(f"\n× Error sending WoL packet: {e}")
             return False
 
+    def stop_monitoring(self):
+        """Signal the monitor thread to exit immediately."""
+        self.is_monitoring = False
+        wakeup = self._monitor_wakeup
+        if wakeup is not None:
+            try:
+                wakeup.send(b'\0')
+            except OSError:
+                pass
+
     def monitor_wol_packets(self, target_mac=None):
         """Monitor for incoming Wake-on-LAN packets."""
         self.is_monitoring = True
         ports = [7, 9]  # Common WoL ports
-        sockets = []
+        sel = selectors.DefaultSelector()
+
+        # Self-pipe: stop_monitoring writes a byte here so the select call
+        # below can block indefinitely yet still exit the moment we're told
+        wakeup_r, wakeup_w = socket.socketpair()
+        wakeup_r.setblocking(False)
+        self._monitor_wakeup = wakeup_w
+        sel.register(wakeup_r, selectors.EVENT_READ, data=None)
 
         try:
             for port in ports:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                # Receive-only socket: SO_BROADCAST is a send-side option,
+                # so it isn't set here. REUSEADDR (plus REUSEPORT where the
+                # platform has it) lets a second monitor instance bind for
+                # debugging, and a 1 MB receive buffer keeps broadcast
+                # bursts from being dropped before we drain them.
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if hasattr(socket, 'SO_REUSEPORT'):
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
                 sock.bind(('', port))
-                sock.settimeout(0.1)
-                sockets.append((sock, port))
+                sock.setblocking(False)
+                sel.register(sock, selectors.EVENT_READ, data=port)
 
             print(f"\n=== Wake-on-LAN Packet Monitor ===")
             print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -190,24 +699,41 @@ class WoLManager:
                 print(f"Filtering for MAC: {target_mac}")
             print("\nWaiting for packets...\n")
 
+            # Preformatted so each packet is reported with one stdout write
+            # instead of six print calls (each of which flushes separately)
+            line_fmt = ("[{timestamp}] WoL Packet Received!\n"
+                        "└─ From: {ip}:{src_port}\n"
+                        "└─ To Port: {port}\n"
+                        "└─ Target MAC: {mac}\n"
+                        "└─ Packet Size: {size} bytes\n"
+                        "└─ Status: Valid Wake-on-LAN magic packet ✓\n\n")
+
+            # One blocking select covers every socket, so the thread sleeps
+            # in the kernel until a packet arrives (or the self-pipe fires)
+            # instead of round-robin polling each port on a timeout
             while self.is_monitoring:
-                for sock, port in sockets:
+                for key, _ in sel.select():
+                    if key.data is None:
+                        # Wakeup byte from stop_monitoring; the outer loop
+                        # re-checks the flag
+                        continue
+                    sock = key.fileobj
+                    port = key.data
                     try:
-                        data, addr = sock.recvfrom(1024)
-                        if len(data) == 102 and data[:6] == b'\xFF' * 6:
-                            mac_bytes = data[6:12]
-                            mac_str = ':'.join(f'{b:02x}' for b in mac_bytes)
-                            
+                        data, addr = sock.recvfrom(2048)
+                        # memoryview comparisons avoid copying slices out of
+                        # every received datagram just to reject it
+                        view = memoryview(data)
+                        if len(data) == 102 and view[:6] == _SYNC:
+                            mac_str = data[6:12].hex(':')
 
                             if not target_mac or mac_str.lower() == target_mac.lower():
-                                timestamp = datetime.now().strftime('%H:%M:%S')
-                                print(f"[{timestamp}] WoL Packet Received!")
-                                print(f"└─ From: {addr[0]}:{addr[1]}")
-                                print(f"└─ To Port: {port}")
-                                print(f"└─ Target MAC: {mac_str}")
-                                print(f"└─ Packet Size: {len(data)} bytes")
-                                print("└─ Status: Valid Wake-on-LAN magic packet ✓\n")
-                    except socket.timeout:
+                                sys.stdout.write(line_fmt.format(
+                                    timestamp=datetime.now().strftime('%H:%M:%S'),
+                                    ip=addr[0], src_port=addr[1], port=port,
+                                    mac=mac_str, size=len(data)))
+                                sys.stdout.flush()
+                    except BlockingIOError:
                         continue
                     except Exception as e:
                         if self.is_monitoring:
@@ -216,20 +742,42 @@ class WoLManager:
         except Exception as e:
             print(f"Error in monitor: {e}")
         finally:
-            for sock, _ in sockets:
+            self._monitor_wakeup = None
+            for key in list(sel.get_map().values()):
                 try:
-                    sock.close()
-                except:
+                    sel.unregister(key.fileobj)
+                    key.fileobj.close()
+                except Exception:
                     pass
+            sel.close()
+            try:
+                wakeup_w.close()
+            except OSError:
+                pass
 
     def start_web_server(self):
-        """Start the Flask web server."""
-        app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
+        """Start the web server (waitress when available, dev server otherwise)."""
+        app = create_app(self)
+        try:
+            from waitress import serve
+        except ImportError:
+            # Werkzeug's dev server handles one request at a time; fine as
+            # a fallback but not for real use
+            app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
+            return
+        serve(app, host='0.0.0.0', port=5000, threads=8, connection_limit=200)
 
     def show_menu(self):
         """Display the main menu."""
+        # readline gives the MAC/broadcast prompts line editing and
+        # history; imported lazily here since only the menu needs it
+        # (pyreadline3 provides it on Windows, if installed)
+        try:
+            import readline  # noqa: F401
+        except ImportError:
+            pass
         while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            _clear_screen()
             print("\n" + "═" * 50)
             print(" Wake-on-LAN Manager ".center(50, "═"))
             print("═" * 50)
@@ -255,8 +803,16 @@ class WoLManager:
             if choice == '1':
                 network_info = self.get_network_info()
                 print("\nNetwork Information:")
-                print(json.dumps(network_info, indent=2))
-                input("\nPress Enter to continue...")
+                if orjson is not None:
+                    sys.stdout.buffer.write(
+                        orjson.dumps(network_info, option=orjson.OPT_INDENT_2)
+                        + b'\n')
+                else:
+                    # Stream straight to stdout instead of building the
+                    # whole pretty-printed string first
+                    json.dump(network_info, sys.stdout, indent=2)
+                    sys.stdout.write('\n')
+                _pause()
                 
             elif choice == '2':
                 network_info = self.get_network_info()
@@ -272,15 +828,15 @@ class WoLManager:
                         print(msg)
                 except ValueError:
                     print("Invalid input")
-                input("\nPress Enter to continue...")
+                _pause()
                 
             elif choice == '3':
                 mac = input("Enter target MAC address (xx:xx:xx:xx:xx:xx): ")
                 broadcast = input("Enter broadcast address (default: 255.255.255.255): ")
                 if not broadcast:
                     broadcast = "255.255.255.255"
-                self.send_wol_packet(mac, broadcast)
-                input("\nPress Enter to continue...")
+                self.send_wol_packet(mac, broadcast, verbose=True)
+                _pause()
                 
             elif choice == '4':
                 if not self.monitor_thread or not self.monitor_thread.is_alive():
@@ -289,13 +845,12 @@ class WoLManager:
                         target=self.monitor_wol_packets, args=(mac if mac else None,))
                     self.monitor_thread.daemon = True
                     self.monitor_thread.start()
-                    print("\nMonitor started! Press Enter to stop...")
-                    input()
-                    self.is_monitoring = False
+                    _pause("\nMonitor started! Press Enter to stop...")
+                    self.stop_monitoring()
                     self.monitor_thread.join()
                 else:
                     print("Monitor is already running!")
-                    input("\nPress Enter to continue...")
+                    _pause()
                 
             elif choice == '5':
                 if not self.web_thread or not self.web_thread.is_alive():
@@ -311,7 +866,7 @@ class WoLManager:
                             print(f"Network: http://{interface['ipv4_address']}:5000")
                 else:
                     print("\nWeb interface is already running!")
-                input("\nPress Enter to continue...")
+                _pause()
                 
             elif choice == '6':
                 print("\n=== BIOS/UEFI Wake-on-LAN Setup Guide ===")
@@ -330,7 +885,7 @@ class WoLManager:
                 print("   - Power Management tab")
                 print("   - Check 'Allow this device to wake the computer'")
                 print("   - Check 'Only allow a magic packet to wake the computer'")
-                input("\nPress Enter to continue...")
+                _pause()
                 
             elif choice == '7':
                 self.check_wol_configuration()
@@ -340,100 +895,79 @@ class WoLManager:
                 self.configure_wol_settings()
             elif choice == '10':
                 print("\nExiting...")
-                self.is_monitoring = False
+                self.stop_monitoring()
                 if self.monitor_thread and self.monitor_thread.is_alive():
                     self.monitor_thread.join()
+                self.close()
                 sys.exit(0)
 
+    @staticmethod
+    def _get_bios_info_registry():
+        """Read BIOS/system identity straight from the registry.
+
+        The same values Win32_BIOS reports live under
+        HKLM\\HARDWARE\\DESCRIPTION\\System\\BIOS; reading them with winreg
+        skips the WMI + PowerShell startup entirely. Returns a list of
+        formatted lines, or raises OSError if the key is unavailable.
+        """
+        fields = [
+            ("SystemManufacturer", "Manufacturer"),
+            ("SystemProductName", "Product"),
+            ("BIOSVendor", "BIOS Vendor"),
+            ("BIOSVersion", "BIOS Version"),
+            ("BIOSReleaseDate", "BIOS Release Date"),
+        ]
+        lines = []
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                            r"HARDWARE\DESCRIPTION\System\BIOS") as key:
+            for value_name, label in fields:
+                try:
+                    value = winreg.QueryValueEx(key, value_name)[0]
+                except OSError:
+                    continue
+                lines.append(f"{label}: {value}")
+        return lines
+
     def check_bios_settings(self):
         """Check BIOS settings related to Wake-on-LAN using PowerShell."""
         print("\n" + "="*50)
         print("CHECKING BIOS/UEFI SETTINGS")
         print("="*50 + "\n")
 
+        # Every query runs in one PowerShell process: each cold start costs
+        # hundreds of milliseconds, so the separate invocations this used
+        # to make spent most of their time just launching PowerShell.
         try:
-            # Get BIOS information using PowerShell
+            result = _run_ps(_PS_BIOS_CHECK_SCRIPT, check=True)
+
+            # Split the combined output back into its sections
+            sections = {}
+            current = None
+            for line in result.stdout.splitlines():
+                marker = line.strip()
+                if marker.startswith('---SECTION:') and marker.endswith('---'):
+                    current = marker[len('---SECTION:'):-3]
+                    sections[current] = []
+                elif current is not None:
+                    sections[current].append(line)
+
             print("\n[1] BIOS Information:")
             print("-" * 20)
-            bios_info = subprocess.check_output(
-                ["powershell", "Get-WmiObject -Class Win32_BIOS | Format-List Manufacturer,Name,Version,SerialNumber"],
-                text=True
-            )
-            print(bios_info)
-            input("Press Enter to continue to power settings...")
-
-            # Get power settings related to Wake-on-LAN
+            try:
+                # Registry first: same data as Win32_BIOS without spinning
+                # up WMI
+                print('\n'.join(self._get_bios_info_registry()))
+            except OSError:
+                sys.stdout.write(_run_ps(_PS_BIOS_FALLBACK_SCRIPT, check=True).stdout)
+
             print("\n[2] Power Settings Related to Wake:")
             print("-" * 20)
-            
-            # Get current power scheme
-            current_scheme = subprocess.check_output(
-                ["powershell", "powercfg /getactivescheme"],
-                text=True
-            ).strip()
-            print("Current Power Scheme:", current_scheme)
-            
-            # Get network adapter settings using registry and advanced queries
-            print("\nNetwork Adapter Settings:")
-            power_settings = subprocess.check_output(
-                ["powershell", """
-                $adapters = Get-NetAdapter | Where-Object {$_.Status -eq 'Up'}
-                foreach ($adapter in $adapters) {
-                    Write-Output "`nAdapter: $($adapter.Name)"
-                    Write-Output "Status: $($adapter.Status)"
-                    Write-Output "Media Type: $($adapter.MediaType)"
-                    Write-Output "Interface Description: $($adapter.InterfaceDescription)"
-                    
-                    # Check registry for Wake-on-LAN settings
-                    $adapterRegPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Class\\{4d36e972-e325-11ce-bfc1-08002be10318}"
-                    Get-ChildItem $adapterRegPath | ForEach-Object {
-                        $regPath = $_.PSPath
-                        $description = (Get-ItemProperty -Path $regPath).DriverDesc
-                        if ($description -eq $adapter.InterfaceDescription) {
-                            $wolMagicPacket = (Get-ItemProperty -Path $regPath).WolMagicPacket
-                            $pmARPOffload = (Get-ItemProperty -Path $regPath).PMARPOffload
-                            $pmNSOffload = (Get-ItemProperty -Path $regPath).PMNSOffload
-                            $pmWakeOnPattern = (Get-ItemProperty -Path $regPath).WakeOnPattern
-                            
-                            Write-Output "`nWake-on-LAN Settings:"
-                            Write-Output "  Wake on Magic Packet: $wolMagicPacket"
-                            Write-Output "  PM ARP Offload: $pmARPOffload"
-                            Write-Output "  PM NS Offload: $pmNSOffload"
-                            Write-Output "  Wake on Pattern: $pmWakeOnPattern"
-                        }
-                    }
-                    Write-Output "-----------------"
-                }"""],
-                text=True
-            )
-            print(power_settings)
-            
-            # Get device wake capabilities
+            print('\n'.join(sections.get('POWER', [])))
+
             print("\n[3] System Wake Capabilities:")
             print("-" * 20)
-            wake_status = subprocess.check_output(
-                ["powershell", """
-                Write-Output "Devices that can wake the system:"
-                $wakeDevices = powercfg /devicequery wake_armed
-                $wakeDevices | ForEach-Object {
-                    Write-Output "  * $_"
-                }
-                
-                Write-Output "`nPower Settings Status:"
-                # Check if Fast Startup is enabled
-                $fastStartup = Get-ItemProperty "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Power" -Name HiberbootEnabled -ErrorAction SilentlyContinue
-                Write-Output "  Fast Startup: $(if ($fastStartup.HiberbootEnabled -eq 1) { 'Enabled' } else { 'Disabled' })"
-                
-                # Check network adapter wake settings
-                Write-Output "`nNetwork Adapter Wake Status:"
-                Get-WmiObject MSPower_DeviceWakeEnable -Namespace root/wmi | ForEach-Object {
-                    $status = if ($_.Enable) { "Enabled" } else { "Disabled" }
-                    Write-Output "  * Wake capability: $status"
-                }"""],
-                text=True
-            )
-            print(wake_status)
-            
+            print('\n'.join(sections.get('WAKE', [])))
+
             print("\nBIOS Settings Check Complete!")
             print("=" * 50)
             
@@ -448,15 +982,15 @@ class WoLManager:
             print("   - Deep Sleep Control is disabled")
             print("   - EuP/ErP Ready is disabled")
             
-            input("\nPress Enter to return to main menu...")
+            _pause("\nPress Enter to return to main menu...")
 
         except subprocess.CalledProcessError as e:
             print(f"\nError checking settings: {e}")
-            input("\nPress Enter to continue...")
+            _pause()
             return False
         except Exception as e:
             print(f"\nUnexpected error: {e}")
-            input("\nPress Enter to continue...")
+            _pause()
             return False
 
         return True
@@ -471,23 +1005,13 @@ class WoLManager:
         # Check Network Adapter Settings
         try:
             # Use PowerShell to get detailed network adapter settings
-            ps_command = """
-            Get-NetAdapter | Where-Object {$_.Status -eq 'Up'} | ForEach-Object {
-                $adapter = $_
-                $pm = Get-NetAdapterPowerManagement -Name $adapter.Name
-                Write-Output "Adapter: $($adapter.Name)"
-                Write-Output "WakeOnMagicPacket: $($pm.WakeOnMagicPacket)"
-                Write-Output "WakeOnPattern: $($pm.WakeOnPattern)"
-                Write-Output "DeviceSleepOnDisconnect: $($pm.DeviceSleepOnDisconnect)"
-            }
-            """
-            result = subprocess.run(["powershell", "-Command", ps_command], 
-                                 capture_output=True, text=True, check=True)
-            
+            result = _run_ps(_PS_ADAPTER_PM_SCRIPT, check=True)
+
             print("Network Adapter Settings:")
-            print(result.stdout)
+            sys.stdout.write(result.stdout)
             
-            if "Disabled" in result.stdout:
+            hits = {m.group(1) for m in _WOL_DIAG_RE.finditer(result.stdout)}
+            if 'Disabled' in hits:
                 issues_found.append("Wake-on-LAN is disabled in network adapter settings")
                 recommendations.append(
                     "Enable WoL in Device Manager:\n"
@@ -502,6 +1026,7 @@ class WoLManager:
             print(f"Could not check network adapter settings: {e}")
         
         # Check if running on battery (for laptops)
+        import psutil
         if hasattr(psutil, "sensors_battery"):
             try:
                 battery = psutil.sensors_battery()
@@ -515,16 +1040,13 @@ class WoLManager:
         
         # Check network connection type
         try:
-            ps_command = """
-            Get-NetAdapter | Where-Object {$_.Status -eq 'Up'} | Select-Object Name, InterfaceDescription, MediaType
-            """
-            result = subprocess.run(["powershell", "-Command", ps_command], 
-                                 capture_output=True, text=True, check=True)
-            
+            result = _run_ps(_PS_CONNECTION_TYPE_SCRIPT, check=True)
+
             print("\nNetwork Connection Type:")
-            print(result.stdout)
+            sys.stdout.write(result.stdout)
             
-            if "Wi-Fi" in result.stdout or "Wireless" in result.stdout:
+            hits = {m.group(1) for m in _WOL_DIAG_RE.finditer(result.stdout)}
+            if hits & {'Wi-Fi', 'WiFi', 'Wireless'}:
                 issues_found.append("Using Wi-Fi connection")
                 recommendations.append(
                     "Use a wired Ethernet connection. WoL is more reliable over Ethernet."
@@ -536,7 +1058,7 @@ class WoLManager:
         try:
             key_path = r"SYSTEM\CurrentControlSet\Control\Session Manager\Power"
             with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
-                fast_startup = winreg.QueryValueEx(key, "HiberbootEnabled")[0]
+                fast_startup = self._read_dword(key, "HiberbootEnabled")
                 print("\nFast Startup:", "Enabled" if fast_startup else "Disabled")
                 
                 if fast_startup:
@@ -574,7 +1096,7 @@ class WoLManager:
         print("   - Allow broadcast packets")
         print("   - If using port forwarding, forward to your PC's MAC address")
         
-        input("\nPress Enter to continue...")
+        _pause()
 
     def configure_wol_settings(self):
         """Configure all necessary Wake-on-LAN settings."""
@@ -582,70 +1104,13 @@ class WoLManager:
         print("=" * 50)
         
         try:
-            # Enable WoL settings using PowerShell (requires admin privileges)
-            wol_script = """
-            # Get the network adapter
-            $adapter = Get-NetAdapter | Where-Object {$_.Status -eq 'Up' -and $_.MediaType -eq '802.3'}
-            
-            if ($adapter) {
-                Write-Output "Configuring adapter: $($adapter.Name)"
-                
-                # Enable WoL in power management
-                $devicePath = $adapter.PnPDeviceID
-                $device = Get-PnpDevice | Where-Object { $_.InstanceId -eq $devicePath }
-                
-                # Registry path for the network adapter
-                $adapterId = ($adapter.InterfaceDescription -replace '[^a-zA-Z0-9]', '_')
-                $regPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Class\\{4d36e972-e325-11ce-bfc1-08002be10318}"
-                
-                Get-ChildItem $regPath | ForEach-Object {
-                    $instancePath = $_.PSPath
-                    if ((Get-ItemProperty -Path $instancePath).DriverDesc -eq $adapter.InterfaceDescription) {
-                        # Enable WoL settings
-                        Set-ItemProperty -Path $instancePath -Name "WolMagicPacket" -Value 1
-                        Set-ItemProperty -Path $instancePath -Name "WakeOnMagicPacket" -Value 1
-                        Set-ItemProperty -Path $instancePath -Name "PMARPOffload" -Value 1
-                        Set-ItemProperty -Path $instancePath -Name "PMNSOffload" -Value 1
-                        Set-ItemProperty -Path $instancePath -Name "WakeOnPattern" -Value 1
-                        Write-Output "Enabled Wake-on-LAN registry settings"
-                    }
-                }
-                
-                # Enable device to wake computer
-                $powerMgmt = Get-WmiObject MSPower_DeviceWakeEnable -Namespace root\\wmi | 
-                    Where-Object { $_.InstanceName -match $adapterId }
-                if ($powerMgmt) {
-                    $powerMgmt.Enable = $true
-                    $powerMgmt.Put()
-                }
-                
-                # Disable Fast Startup
-                $regPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Power"
-                Set-ItemProperty -Path $regPath -Name "HiberbootEnabled" -Value 0
-                Write-Output "Disabled Fast Startup"
-                
-                # Configure Power Settings
-                # Prevent sleep when plugged in
-                powercfg /change standby-timeout-ac 0
-                
-                # Enable wake timers
-                powercfg /setacvalueindex scheme_current sub_buttons pbuttonaction 0
-                powercfg /setacvalueindex scheme_current sub_none wakefromlan 1
-                powercfg /setactive scheme_current
-                
-                Write-Output "Power settings configured successfully"
-            } else {
-                Write-Output "No suitable network adapter found"
-            }
-            """
-            
             print("\nAttempting to configure Wake-on-LAN settings (requires admin privileges)...")
-            result = subprocess.run(
-                ["powershell", "-Command", wol_script],
-                capture_output=True,
-                text=True
-            )
+            result = _run_ps(_PS_CONFIGURE_WOL_SCRIPT)
             
+            # Registry/power settings may have changed either way
+            self.invalidate_network_info()
+            self._netcfg_index = None
+
             if result.returncode == 0:
                 print("\nSuccessfully configured Wake-on-LAN settings!")
                 print("\nSettings applied:")
@@ -665,40 +1130,84 @@ class WoLManager:
             else:
                 print("\nError configuring settings. Make sure to run as administrator.")
                 print("Error details:")
-                print(result.stderr)
+                sys.stdout.write(result.stderr)
             
-            input("\nPress Enter to continue...")
+            _pause()
             
         except Exception as e:
             print(f"\nError: {str(e)}")
             print("Make sure to run the program as administrator.")
-            input("\nPress Enter to continue...")
-
-# Flask routes
-@app.route('/')
-def index():
-    network_info = wol_manager.get_network_info()
-    return render_template('index.html', network_info=network_info)
-
-@app.route('/wake', methods=['POST'])
-def wake():
-    try:
-        data = request.json
-        mac_address = data.get('mac_address')
-        broadcast = data.get('broadcast', '255.255.255.255')
-        
-        if not mac_address:
-            return jsonify({'error': 'MAC address is required'}), 400
-            
-        success = wol_manager.send_wol_packet(mac_address, broadcast)
-        
-        if success:
-            return jsonify({'message': 'Wake-on-LAN packet sent successfully'})
-        else:
-            return jsonify({'error': 'Failed to send Wake-on-LAN packet'}), 500
-            
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            _pause()
+
+def create_app(manager):
+    """Build the Flask app for a manager instance.
+
+    Flask is imported here rather than at module level so CLI-only runs
+    never pay its import cost; the app only exists once the web interface
+    is actually started.
+    """
+    from flask import Flask, jsonify, request, send_from_directory
+
+    app = Flask(__name__)
+
+    if orjson is not None:
+        from flask.json.provider import JSONProvider
+
+        class OrjsonProvider(JSONProvider):
+            """Serve jsonify responses through orjson instead of stdlib json."""
+
+            def dumps(self, obj, **kwargs):
+                return orjson.dumps(obj).decode()
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        app.json = OrjsonProvider(app)
+
+    manager.start_snapshot_refresh()
+
+    @app.route('/')
+    def index():
+        # Static shell; the page fetches /api/network_info and renders
+        # client-side, so no Jinja work happens per hit
+        return send_from_directory(app.static_folder, 'index.html')
+
+    @app.route('/api/network_info')
+    def network_info_api():
+        # Conditional GET: when the snapshot hasn't changed since the
+        # browser's copy, skip the body entirely
+        etag = manager._snapshot_etag
+        if etag and request.if_none_match.contains(etag):
+            return '', 304
+
+        response = jsonify(manager.get_network_info())
+        response.headers['Cache-Control'] = 'max-age=5'
+        if etag:
+            response.set_etag(etag)
+        return response
+
+    @app.route('/wake', methods=['POST'])
+    def wake():
+        try:
+            data = request.json
+            mac_address = data.get('mac_address')
+            broadcast = data.get('broadcast', '255.255.255.255')
+
+            if not mac_address:
+                return jsonify({'error': 'MAC address is required'}), 400
+
+            success = manager.send_wol_packet(mac_address, broadcast)
+
+            if success:
+                return jsonify({'message': 'Wake-on-LAN packet sent successfully'})
+            else:
+                return jsonify({'error': 'Failed to send Wake-on-LAN packet'}), 500
+
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+
+    return app
+
 
 if __name__ == "__main__":
     wol_manager = WoLManager()
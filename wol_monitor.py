@@ -1,88 +1,160 @@
+import selectors
 import socket
 import struct
+import threading
 import time
 from datetime import datetime
 
+# Low six bytes of the packet's first quadword (little-endian) are the
+# 0xFF synchronization stream; one masked integer compare checks them all
+_MAGIC_MASK = 0x0000FFFFFFFFFFFF
+
+
 def is_wol_packet(data, target_mac=None):
     """Check if the received data is a Wake-on-LAN magic packet."""
     if len(data) != 102:  # WoL magic packet is always 102 bytes
         return False
-    
+
     # Check for 6 bytes of 0xFF
-    if data[:6] != b'\xFF' * 6:
+    if struct.unpack_from('<Q', data, 0)[0] & _MAGIC_MASK != _MAGIC_MASK:
         return False
-    
-    # Extract the MAC address from the packet
-    mac_bytes = data[6:12]
-    mac_str = ':'.join(f'{b:02x}' for b in mac_bytes)
-    
+
+    # Extract the MAC address from the packet; bytes.hex does the
+    # per-byte formatting in C
+    mac_str = data[6:12].hex(':')
+
     # If a target MAC is specified, check if this packet is for that MAC
     if target_mac:
         target_mac_clean = target_mac.replace(':', '').replace('-', '').lower()
         packet_mac_clean = mac_str.replace(':', '').lower()
         if target_mac_clean != packet_mac_clean:
             return False
-    
+
     return True, mac_str
 
-def monitor_wol_packets(target_mac=None, ports=[7, 9]):
+
+def _open_monitor_socket(port, reuseport=False):
+    """Create a non-blocking UDP socket bound to the given port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuseport:
+        # With SO_REUSEPORT the kernel hashes incoming datagrams across
+        # every socket bound to the port, one receive queue per worker
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    # Ask for a 2 MB receive buffer so broadcast bursts queue in the
+    # kernel instead of being dropped; the grant is capped by
+    # net.core.rmem_max on Linux, so raise that sysctl for the full size
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 2 * 1024 * 1024)
+    sock.bind(('', port))
+    sock.setblocking(False)
+    return sock
+
+
+def _recv_loop(sel, target_mac, stop, verbose=True):
+    """Drain one worker's sockets until the stop event is set."""
+    # One reusable buffer for every datagram; recvmsg_into writes the
+    # payload straight into it instead of allocating a fresh bytes
+    # object per packet
+    buf = bytearray(2048)
+    mv = memoryview(buf)
+
+    while not stop.is_set():
+        for key, _ in sel.select(0.5):
+            sock = key.fileobj
+            port = key.data
+            try:
+                nbytes, _, _, addr = sock.recvmsg_into([mv])
+                data = mv[:nbytes]
+                result = is_wol_packet(data, target_mac)
+
+                if result and verbose:
+                    _, mac = result
+                    timestamp = datetime.now().strftime('%H:%M:%S')
+                    print(f"[{timestamp}] WoL Packet Received!")
+                    print(f"└─ From: {addr[0]}:{addr[1]}")
+                    print(f"└─ To Port: {port}")
+                    print(f"└─ Target MAC: {mac}")
+                    print(f"└─ Packet Size: {len(data)} bytes")
+                    print("└─ Status: Valid Wake-on-LAN magic packet ✓\n")
+            except BlockingIOError:
+                continue
+            except Exception as e:
+                print(f"Error receiving packet: {e}")
+
+
+def monitor_wol_packets(target_mac=None, ports=[7, 9], workers=None,
+                        verbose=True):
     """
     Monitor for Wake-on-LAN packets.
-    
+
     Args:
         target_mac (str): Optional MAC address to filter for specific packets
         ports (list): List of ports to monitor (default: 7 and 9, common WoL ports)
+        workers (int): Number of receive workers (default: 1). Values
+            above 1 need SO_REUSEPORT and only help with unicast floods —
+            the kernel balances unicast across the reuseport group but
+            delivers each broadcast datagram to every socket in it, so
+            typical (broadcast) WoL traffic would just be reported once
+            per worker.
+        verbose (bool): Print a report per valid packet. Disable when
+            monitoring floods to keep console formatting off the hot path.
     """
-    sockets = []
-    
+    # Multiple sockets per port are opt-in (see the docstring) and need
+    # SO_REUSEPORT; without it (Windows, older BSDs) force one worker
+    reuseport = hasattr(socket, 'SO_REUSEPORT')
+    if workers is None or not reuseport:
+        workers = 1
+
+    stop = threading.Event()
+    sels = []
+
     try:
-        # Create a socket for each port
-        for port in ports:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.bind(('', port))
-            sock.settimeout(0.1)  # Small timeout for non-blocking operation
-            sockets.append((sock, port))
-        
+        for _ in range(workers):
+            sel = selectors.DefaultSelector()
+            for port in ports:
+                sock = _open_monitor_socket(port, reuseport=workers > 1)
+                sel.register(sock, selectors.EVENT_READ, data=port)
+            sels.append(sel)
+
         print(f"\n=== Wake-on-LAN Packet Monitor ===")
         print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Monitoring ports: {', '.join(map(str, ports))}")
+        if workers > 1:
+            print(f"Receive workers: {workers}")
         if target_mac:
             print(f"Filtering for MAC: {target_mac}")
         print("\nWaiting for packets...\n")
-        
+
+        threads = [
+            threading.Thread(target=_recv_loop,
+                             args=(sel, target_mac, stop, verbose),
+                             daemon=True)
+            for sel in sels[1:]
+        ]
+        for thread in threads:
+            thread.start()
+
         try:
-            while True:
-                for sock, port in sockets:
-                    try:
-                        data, addr = sock.recvfrom(1024)
-                        is_wol, mac = is_wol_packet(data, target_mac)
-                        
-                        if is_wol:
-                            timestamp = datetime.now().strftime('%H:%M:%S')
-                            print(f"[{timestamp}] WoL Packet Received!")
-                            print(f"└─ From: {addr[0]}:{addr[1]}")
-                            print(f"└─ To Port: {port}")
-                            print(f"└─ Target MAC: {mac}")
-                            print(f"└─ Packet Size: {len(data)} bytes")
-                            print("└─ Status: Valid Wake-on-LAN magic packet ✓\n")
-                    except socket.timeout:
-                        continue
-                    except Exception as e:
-                        print(f"Error receiving packet: {e}")
-                
+            # The first selector runs in this thread so Ctrl+C lands here
+            _recv_loop(sels[0], target_mac, stop, verbose)
         except KeyboardInterrupt:
             print("\nMonitoring stopped by user.")
-            
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
     except Exception as e:
         print(f"Error setting up monitor: {e}")
-    
+
     finally:
-        for sock, _ in sockets:
-            try:
-                sock.close()
-            except:
-                pass
+        for sel in sels:
+            for key in list(sel.get_map().values()):
+                try:
+                    key.fileobj.close()
+                except:
+                    pass
+            sel.close()
 
 if __name__ == "__main__":
     # You can specify your MAC address here to filter packets
@@ -0,0 +1,16 @@
+"""
+WSGI entry point for the Wake-on-LAN web app.
+
+Run behind a production server instead of the Werkzeug dev server, e.g.:
+
+    gunicorn -w 4 -k gthread --threads 8 wsgi:app
+    waitress-serve --host 0.0.0.0 --port 5000 wsgi:app
+
+All heavy work (network scans, registry reads) happens lazily inside the
+request handlers, so importing this module is cheap for every worker.
+"""
+
+from app import app
+
+if __name__ == "__main__":
+    app.run(host='0.0.0.0', port=5000, threaded=True)